@@ -103,21 +103,25 @@ class MetricHistory:
         else:
             self._observations[step] = MetricObservation(value, step=step)
 
+    def _get_means(self):
+        return np.array([obs.mean() for obs in self._observations.values()])
+
     def get_best_value(self):
-        values = [obs.mean() for obs in self._observations.values()]
-        if not values:
+        means = self._get_means()
+        if not means.size:
             return None
-        return (
-            np.nanmin(values) if self.direction == "min" else np.nanmax(values)
-        )
+        return np.nanmin(means) if self.direction == "min" else np.nanmax(means)
 
     def get_best_step(self):
-        best_value = self.get_best_value()
-        if best_value is None:
+        means = self._get_means()
+        if not means.size or np.isnan(means).all():
             return None
-        for obs in self._observations.values():
-            if obs.mean() == best_value:
-                return obs.step
+        index = (
+            np.nanargmin(means)
+            if self.direction == "min"
+            else np.nanargmax(means)
+        )
+        return list(self._observations.values())[index].step
 
     def get_history(self):
         return sorted(self._observations.values(), key=lambda obs: obs.step)
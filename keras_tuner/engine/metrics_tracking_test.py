@@ -132,6 +132,22 @@ def test_get_best_value():
     assert tracker.get_best_value("metric_max") == 3.0
 
 
+def test_get_best_step():
+    tracker = metrics_tracking.MetricsTracker()
+    tracker.register("metric_min", "min")
+    tracker.register("metric_max", "max")
+    tracker.register("metric_nan", "min")
+
+    for step, value in enumerate([2.0, float("nan"), 1.0, 3.0, 1.0]):
+        tracker.update("metric_min", value, step=step)
+        tracker.update("metric_max", value, step=step)
+        tracker.update("metric_nan", float("nan"), step=step)
+
+    assert tracker.get_best_step("metric_min") == 2
+    assert tracker.get_best_step("metric_max") == 3
+    assert tracker.get_best_step("metric_nan") is None
+
+
 def test_get_statistics():
     tracker = metrics_tracking.MetricsTracker()
     history = [
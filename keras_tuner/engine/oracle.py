@@ -20,11 +20,11 @@ import os
 import random
 import threading
 import warnings
+from concurrent import futures
 from datetime import datetime
 
 import numpy as np
 
-from keras_tuner import backend
 from keras_tuner import utils
 from keras_tuner.api_export import keras_tuner_export
 from keras_tuner.engine import hyperparameters as hp_module
@@ -748,15 +748,21 @@ class Oracle(stateful.Stateful):
         super().save(self._get_oracle_fname())
 
     def reload(self):
-        # Reload trials from their own files.
-        trial_fnames = backend.io.glob(
-            os.path.join(self._project_dir, "trial_*", "trial.json")
-        )
-        for fname in trial_fnames:
-            trial = trial_module.Trial.load(fname)
-            self.trials[trial.trial_id] = trial
+        state = utils.load_json(self._get_oracle_fname())
+        # Reload trials from their own files. All the trial IDs are recorded in
+        # the state, so the project directory is not globbed.
+        project_dir = self._project_dir
+        trial_fnames = [
+            os.path.join(project_dir, f"trial_{str(trial_id)}", "trial.json")
+            for trial_id in state.get("start_order", [])
+        ]
+        # Reading the trial files is I/O bound, so read them concurrently.
+        max_workers = min(32, len(trial_fnames)) or 1
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for trial in executor.map(trial_module.Trial.load, trial_fnames):
+                self.trials[trial.trial_id] = trial
         try:
-            super().reload(self._get_oracle_fname())
+            self.set_state(state)
         except KeyError as e:
             raise RuntimeError(
                 "Error reloading `Oracle` from existing project. "
@@ -799,10 +805,12 @@ class Oracle(stateful.Stateful):
         utils.create_directory(dirname)
         return dirname
 
+    def _get_trial_fname(self, trial_id):
+        return os.path.join(self._get_trial_dir(trial_id), "trial.json")
+
     def _save_trial(self, trial):
         # Write trial status to trial directory
-        trial_id = trial.trial_id
-        trial.save(os.path.join(self._get_trial_dir(trial_id), "trial.json"))
+        trial.save(self._get_trial_fname(trial.trial_id))
 
     def _random_values(self):
         """Fills the hyperparameter space with random values.
@@ -812,10 +820,11 @@ class Oracle(stateful.Stateful):
         """
         collisions = 0
         while 1:
+            # Only the values are needed to check the conditions. Merging the
+            # space would copy every `HyperParameter` on each attempt.
             hps = hp_module.HyperParameters()
             # Generate a set of random values.
             for hp in self.hyperparameters.space:
-                hps.merge([hp])
                 if hps.is_active(hp):  # Only active params in `values`.
                     hps.values[hp.name] = hp.random_sample(self._seed_state)
                     self._seed_state += 1
@@ -850,10 +859,9 @@ class Oracle(stateful.Stateful):
         old_hash_value = self._id_to_hash[trial.trial_id]
         if old_hash_value != new_hash_value:
             self._id_to_hash[trial.trial_id] = new_hash_value
-            # Check before removing. If this is a retry run, the old value may
-            # have been removed already.
-            if old_hash_value in self._tried_so_far:
-                self._tried_so_far.remove(old_hash_value)
+            # If this is a retry run, the old value may have been removed
+            # already.
+            self._tried_so_far.discard(old_hash_value)
 
 
 def _maybe_infer_direction_from_objective(objective, metric_name):
@@ -155,6 +155,33 @@ def test_new_hp_duplicate(tmp_path):
     assert len(oracle.start_order) == 2
 
 
+def test_values_hash_is_stable(tmp_path):
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    # The hashes are saved in `oracle.json`, so changing them would break
+    # the duplicate detection of reloaded projects.
+    assert (
+        oracle._compute_values_hash({"hp2": "a", "hp1": 1})
+        == oracle._compute_values_hash({"hp1": 1, "hp2": "a"})
+        == "314d826ccb9df9d7b423132860a229f4"
+    )
+
+
+def test_random_values_only_active(tmp_path):
+    hps = keras_tuner.HyperParameters()
+    hps.Choice("model", ["a", "b"])
+    with hps.conditional_scope("model", ["a"]):
+        hps.Int("a_units", 1, 10)
+    with hps.conditional_scope("model", ["b"]):
+        hps.Int("b_units", 1, 10)
+    oracle = OracleStub(
+        directory=tmp_path, objective="val_loss", hyperparameters=hps
+    )
+
+    for _ in range(10):
+        values = oracle._random_values()
+        assert set(values.keys()) == {"model", f"{values['model']}_units"}
+
+
 def test_default_no_retry(tmp_path):
     oracle = OracleStub(directory=tmp_path, objective="val_loss")
     trial_1 = oracle.create_trial(tuner_id="a")
@@ -450,3 +477,64 @@ def test_display_format_duration_large_d():
     oracle.verbose = "auto"
     assert oracle_module.Display(oracle).format_duration(d) == "7d 00h 00m 00s"
     assert oracle.verbose == 1
+
+
+def test_reload_restores_all_trials(tmp_path):
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    scores = {}
+    for i in range(20):
+        trial = oracle.create_trial(tuner_id="a")
+        oracle.update_trial(trial.trial_id, {"val_loss": float(i)})
+        trial.status = trial_module.TrialStatus.COMPLETED
+        oracle.end_trial(trial)
+        scores[trial.trial_id] = float(i)
+
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    oracle.reload()
+
+    assert {
+        trial_id: trial.score for trial_id, trial in oracle.trials.items()
+    } == scores
+
+
+def test_reload_only_loads_recorded_trials(tmp_path):
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    trial = oracle.create_trial(tuner_id="a")
+    oracle.update_trial(trial.trial_id, {"val_loss": 1.0})
+    trial.status = trial_module.TrialStatus.COMPLETED
+    oracle.end_trial(trial)
+    # A leftover trial directory unknown to the oracle state.
+    stray = trial_module.Trial(oracle.get_space(), trial_id="stray")
+    stray.save(oracle._get_trial_fname("stray"))
+
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    oracle.reload()
+
+    assert list(oracle.trials.keys()) == [trial.trial_id]
+
+
+def test_reload_does_not_create_trial_dirs(tmp_path):
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    trial = oracle.create_trial(tuner_id="a")
+    oracle.save()
+    trial_dir = tmp_path / "name" / f"trial_{trial.trial_id}"
+    (trial_dir / "trial.json").unlink()
+    trial_dir.rmdir()
+
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    # The error type depends on the file I/O backend.
+    with pytest.raises(Exception):
+        oracle.reload()
+    assert not trial_dir.exists()
+
+
+def test_reload_corrupt_trial_not_reported_as_project_mismatch(tmp_path):
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    trial = oracle.create_trial(tuner_id="a")
+    trial_fname = oracle._get_trial_fname(trial.trial_id)
+    with open(trial_fname, "w") as f:
+        f.write("{}")
+
+    oracle = OracleStub(directory=tmp_path, objective="val_loss")
+    with pytest.raises(KeyError):
+        oracle.reload()
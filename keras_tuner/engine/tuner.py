@@ -17,6 +17,7 @@
 import contextlib
 import copy
 import gc
+import inspect
 import math
 import os
 
@@ -31,6 +32,12 @@ from keras_tuner.backend import keras
 from keras_tuner.engine import base_tuner
 from keras_tuner.engine import tuner_utils
 
+# Newer versions of `clear_session()` already run `gc.collect()`, which is a
+# full pass over the heap, so avoid running it twice.
+_CLEAR_SESSION_COLLECTS = (
+    "free_memory" in inspect.signature(keras.backend.clear_session).parameters
+)
+
 
 @keras_tuner_export(
     [
@@ -158,8 +165,7 @@ class Tuner(base_tuner.BaseTuner):
 
     def _try_build(self, hp):
         # clean-up TF graph from previously stored (defunct) graph
-        keras.backend.clear_session()
-        gc.collect()
+        _clear_session()
 
         model = self._build_hypermodel(hp)
         # Stop if `build()` does not return a valid model.
@@ -457,6 +463,13 @@ class Tuner(base_tuner.BaseTuner):
         )
 
 
+def _clear_session():
+    """Clear the Keras session with a single garbage collection pass."""
+    keras.backend.clear_session()
+    if not _CLEAR_SESSION_COLLECTS:
+        gc.collect()
+
+
 def maybe_compute_model_size(model):
     """Compute the size of a given model, if it has been built."""
     if model.built:
@@ -1563,3 +1563,9 @@ def test_callback_cannot_be_deep_copied(tmp_path):
         match="All callbacks used during a search should be deep-copyable",
     ):
         tuner.search(callbacks=[keras_tuner])
+
+
+def test_clear_session_collects_garbage_once():
+    with patch("gc.collect") as mock_collect:
+        tuner_module._clear_session()
+    assert mock_collect.call_count == 1
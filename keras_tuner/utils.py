@@ -103,6 +103,8 @@ def load_json(path):
     Returns:
         A Python object.
     """
-    with backend.io.File(path, "r") as f:
-        obj_str = f.read()
-    return json.loads(obj_str)
+    # Read bytes so `json.loads()` detects the UTF encoding instead of
+    # decoding with the locale's default encoding.
+    with backend.io.File(path, "rb") as f:
+        obj_bytes = f.read()
+    return json.loads(obj_bytes)
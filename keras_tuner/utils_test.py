@@ -31,3 +31,10 @@ def test_try_clear_without_ipython():
 
 def test_create_directory_and_remove_existing(tmp_path):
     utils.create_directory(tmp_path, remove_existing=True)
+
+
+def test_save_and_load_json(tmp_path):
+    path = str(tmp_path / "state.json")
+    obj = {"name": "trial_é", "value": float("inf"), "list": [1, None]}
+    utils.save_json(path, obj)
+    assert utils.load_json(path) == obj